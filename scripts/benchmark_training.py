@@ -0,0 +1,139 @@
+#!/usr/bin/env python3
+"""
+Benchmark the training pipeline on synthetic data at increasing scales
+"""
+
+import os
+import sys
+import json
+import time
+import argparse
+import resource
+import tempfile
+import multiprocessing
+from queue import Empty
+
+# Add the project root (parent of scripts/) to sys.path
+project_root = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, project_root)
+
+DEFAULT_SCALES = [891, 100_000, 1_000_000, 10_000_000]
+
+def peak_rss_mb():
+    """Peak resident set size of the current process in MB"""
+    # ru_maxrss is reported in KB on Linux and in bytes on macOS
+    peak = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+    return peak / (1024 * 1024) if sys.platform == "darwin" else peak / 1024
+
+def run_stages(data_path, rows, queue):
+    """Run load, preprocessing, fitting and saving, reporting one result per stage
+
+    Runs in a fresh process per scale so peak RSS is not inherited from smaller
+    runs. Peak RSS is the process high-water mark at the end of each stage.
+    """
+    import pandas as pd
+    from src.train_model import preprocess_data, build_model, save_artifacts
+
+    def record(stage, start):
+        elapsed = time.perf_counter() - start
+        queue.put({
+            "rows": rows,
+            "stage": stage,
+            "seconds": round(elapsed, 3),
+            "rows_per_second": round(rows / elapsed) if elapsed > 0 else None,
+            "peak_rss_mb": round(peak_rss_mb(), 1),
+        })
+
+    start = time.perf_counter()
+    df = pd.read_csv(data_path)
+    record("load", start)
+
+    start = time.perf_counter()
+    X, y, label_encoders, scaler = preprocess_data(df)
+    record("preprocess", start)
+    del df
+
+    start = time.perf_counter()
+    model = build_model()
+    model.fit(X, y)
+    record("fit", start)
+
+    with tempfile.TemporaryDirectory() as models_dir:
+        start = time.perf_counter()
+        save_artifacts(model, label_encoders, scaler, X.columns.tolist(), models_dir=models_dir)
+        record("save", start)
+
+def benchmark_scale(data_path, rows, timeout):
+    """Benchmark one scale in a child process; failures are recorded, not raised"""
+    queue = multiprocessing.Queue()
+    process = multiprocessing.Process(target=run_stages, args=(data_path, rows, queue))
+    process.start()
+    process.join(timeout)
+
+    if process.is_alive():
+        process.terminate()
+        process.join()
+        error = f"timed out after {timeout}s"
+    elif process.exitcode != 0:
+        # A negative exit code is the killing signal, e.g. -9 from the OOM killer
+        error = f"exited with code {process.exitcode}"
+    else:
+        error = None
+
+    results = []
+    while True:
+        try:
+            results.append(queue.get(timeout=1))
+        except Empty:
+            break
+    if error:
+        results.append({"rows": rows, "stage": "error", "error": error})
+    return results
+
+def main():
+    """Generate synthetic data at each scale and benchmark the training pipeline"""
+    parser = argparse.ArgumentParser(description="Benchmark training at several data scales")
+    parser.add_argument("--scales", type=int, nargs="+", default=DEFAULT_SCALES,
+                        help="Row counts to benchmark")
+    parser.add_argument("--seed", type=int, default=42, help="Synthetic data seed")
+    parser.add_argument("--timeout", type=int, default=3600, help="Seconds allowed per scale")
+    parser.add_argument("--data-dir", default=None,
+                        help="Directory for generated CSVs (default: temporary, removed afterwards)")
+    parser.add_argument("--output", default=None, help="Write results as JSON to this path")
+    args = parser.parse_args()
+
+    from src.synthetic_data import write_synthetic_data
+
+    print("Titanic Survival API - Training Benchmark")
+    print("=" * 40)
+
+    results = []
+    with tempfile.TemporaryDirectory() as tmp_dir:
+        data_dir = args.data_dir or tmp_dir
+        for rows in args.scales:
+            data_path = os.path.join(data_dir, f"synthetic_{rows}.csv")
+            if not os.path.exists(data_path):
+                print(f"Generating {rows} synthetic rows...")
+                write_synthetic_data(data_path, rows, seed=args.seed)
+
+            print(f"Benchmarking {rows} rows...")
+            scale_results = benchmark_scale(data_path, rows, args.timeout)
+            for result in scale_results:
+                if result["stage"] == "error":
+                    print(f"  {result['error']}")
+                else:
+                    print(f"  {result['stage']:<11} {result['seconds']:>10.3f}s "
+                          f"{result['rows_per_second'] or 0:>12} rows/s "
+                          f"{result['peak_rss_mb']:>10.1f} MB peak RSS")
+            results.extend(scale_results)
+
+    if args.output:
+        with open(args.output, "w") as f:
+            json.dump(results, f, indent=2)
+        print(f"Results written to {args.output}")
+
+    return all(result["stage"] != "error" for result in results)
+
+if __name__ == "__main__":
+    success = main()
+    sys.exit(0 if success else 1)
@@ -0,0 +1,82 @@
+#!/usr/bin/env python3
+"""
+Compare early-exit forest evaluation against full evaluation on data/titanic.csv
+"""
+
+import os
+import sys
+import time
+import argparse
+
+import numpy as np
+import pandas as pd
+
+# Add the project root (parent of scripts/) to sys.path
+project_root = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, project_root)
+
+from src.predictor import TitanicPredictor
+from src.train_model import preprocess_data
+
+def time_per_row(predict, X):
+    """Latency in milliseconds of predicting each row as its own request"""
+    latencies = []
+    for i in range(len(X)):
+        start = time.perf_counter()
+        predict(X[i:i + 1])
+        latencies.append((time.perf_counter() - start) * 1000)
+    return np.array(latencies)
+
+def report(name, y, full_prob, full_latency, early_prob, trees_evaluated, early_latency, n_trees):
+    """Print accuracy and latency of one early-exit configuration against full evaluation"""
+    full_labels = np.array([TitanicPredictor.confidence_level(p) for p in full_prob])
+    early_labels = np.array([TitanicPredictor.confidence_level(p) for p in early_prob])
+
+    print(f"\n{name}")
+    print("-" * 40)
+    print(f"Class agreement:      {np.mean((full_prob > 0.5) == (early_prob > 0.5)):.2%}")
+    print(f"Confidence agreement: {np.mean(full_labels == early_labels):.2%}")
+    print(f"Mean |prob diff|:     {np.mean(np.abs(full_prob - early_prob)):.4f}")
+    print(f"Accuracy full/early:  {np.mean((full_prob > 0.5) == y):.4f} / {np.mean((early_prob > 0.5) == y):.4f}")
+    print(f"Trees evaluated:      mean {trees_evaluated.mean():.1f}, median {np.median(trees_evaluated):.0f} of {n_trees}")
+    for label in ["High", "Medium", "Low"]:
+        mask = full_labels == label
+        if mask.any():
+            print(f"  {label:<7} ({mask.sum():>3} rows): mean {trees_evaluated[mask].mean():.1f} trees")
+    print(f"Latency p50 full/early: {np.percentile(full_latency, 50):.3f} / {np.percentile(early_latency, 50):.3f} ms")
+    print(f"Latency p95 full/early: {np.percentile(full_latency, 95):.3f} / {np.percentile(early_latency, 95):.3f} ms")
+
+def main():
+    """Score the reference data with full and early-exit evaluation and print the report"""
+    parser = argparse.ArgumentParser(description="Early-exit accuracy/latency report")
+    parser.add_argument("--data", default="data/titanic.csv", help="Labelled passenger CSV")
+    args = parser.parse_args()
+
+    print("Titanic Survival API - Early-Exit Report")
+    print("=" * 40)
+
+    predictor = TitanicPredictor()
+    if not predictor.load_model():
+        return False
+
+    df = pd.read_csv(args.data)
+    # Training-time features, so accuracy is the model's real in-sample figure
+    X, y, _, _ = preprocess_data(df)
+    X = X.values
+    y = y.to_numpy()
+    n_trees = len(predictor.model.estimators_)
+    print(f"Scoring {len(df)} passengers, one request per row, {n_trees} trees")
+
+    full_prob = predictor.model.predict_proba(X)[:, 1]
+    full_latency = time_per_row(predictor.model.predict_proba, X)
+
+    early_prob, trees_evaluated = predictor.predict_proba_early_exit(X)
+    early_latency = time_per_row(predictor.predict_proba_early_exit, X)
+    report("Early exit vs full evaluation", y, full_prob, full_latency,
+           early_prob, trees_evaluated, early_latency, n_trees)
+
+    return True
+
+if __name__ == "__main__":
+    success = main()
+    sys.exit(0 if success else 1)
@@ -0,0 +1,302 @@
+import io
+import json
+import multiprocessing
+import os
+import shutil
+import threading
+import time
+import uuid
+from concurrent.futures import ProcessPoolExecutor
+from datetime import datetime
+from itertools import islice
+from typing import Dict, Any, List, Optional
+
+import pandas as pd
+
+from predictor import TitanicPredictor
+
+JOBS_DIR = os.getenv("JOBS_DIR", "jobs")
+JOBS_MAX_CONCURRENT = int(os.getenv("JOBS_MAX_CONCURRENT", "1"))
+JOBS_CHUNK_SIZE = int(os.getenv("JOBS_CHUNK_SIZE", "5000"))
+# Niceness added to worker processes so the OS schedules API requests first
+JOBS_WORKER_NICE = int(os.getenv("JOBS_WORKER_NICE", "19"))
+
+RESULT_COLUMNS = ["row", "survived", "survival_probability", "confidence"]
+
+# Statuses a job can be resumed from after a restart
+UNFINISHED_STATUSES = ("queued", "running")
+
+
+class JobManager:
+    """Runs batch scoring jobs on a bounded worker pool with progress kept on disk
+
+    Each job lives in its own directory under ``jobs_dir``::
+
+        <job_id>/input.csv     uploaded or copied input file
+        <job_id>/results.csv   scored rows, appended one chunk at a time
+        <job_id>/state.json    status, progress and timestamps
+
+    ``state.json`` is rewritten after every chunk together with the byte size of
+    ``results.csv`` and the byte offset reached in ``input.csv``, so a job
+    interrupted by a restart seeks straight back to the last completed chunk and
+    any partially written chunk is truncated away. Input rows are read one line
+    per record.
+
+    Jobs are scored in separate, lower-priority worker processes, each with its
+    own single-threaded copy of the model. Scoring never holds the API process's
+    GIL and uses at most one core per running job, which keeps /predict latency
+    low while a job runs.
+    """
+
+    def __init__(self, jobs_dir: str = JOBS_DIR, max_concurrent: int = JOBS_MAX_CONCURRENT,
+                 chunk_size: int = JOBS_CHUNK_SIZE, worker_nice: int = JOBS_WORKER_NICE):
+        self.jobs_dir = jobs_dir
+        self.max_concurrent = max(1, max_concurrent)
+        self.chunk_size = max(1, chunk_size)
+        self.worker_nice = worker_nice
+        self.executor = None
+        self._lock = threading.Lock()
+        self._context = multiprocessing.get_context("spawn")
+        self._stopping = self._context.Event()
+
+    def start(self) -> List[str]:
+        """Start the worker pool and requeue jobs left unfinished by a previous process"""
+        os.makedirs(self.jobs_dir, exist_ok=True)
+        self._stopping.clear()
+        self.executor = ProcessPoolExecutor(max_workers=self.max_concurrent, mp_context=self._context,
+                                            initializer=_init_worker, initargs=(self._stopping, self.worker_nice))
+
+        resumed = []
+        for state in sorted(self._all_states(), key=lambda s: s["created_at"]):
+            if state["status"] in UNFINISHED_STATUSES:
+                self._update_state(state["job_id"], status="queued")
+                self.executor.submit(_run_job, self.jobs_dir, state["job_id"], self.chunk_size)
+                resumed.append(state["job_id"])
+        return resumed
+
+    def shutdown(self):
+        """Stop the worker pool; running jobs stop after their current chunk"""
+        self._stopping.set()
+        if self.executor is not None:
+            self.executor.shutdown(wait=True, cancel_futures=True)
+            self.executor = None
+
+    def submit(self, source_path: Optional[str] = None, fileobj=None, filename: Optional[str] = None) -> Dict[str, Any]:
+        """Register a new job from a local file path or an open file object and queue it"""
+        if self.executor is None:
+            raise RuntimeError("Job manager not started")
+
+        job_id = uuid.uuid4().hex
+        job_dir = self._job_dir(job_id)
+        os.makedirs(job_dir)
+
+        input_path = os.path.join(job_dir, "input.csv")
+        if fileobj is not None:
+            with open(input_path, "wb") as f:
+                shutil.copyfileobj(fileobj, f)
+        else:
+            shutil.copyfile(source_path, input_path)
+
+        state = {
+            "job_id": job_id,
+            "status": "queued",
+            "source": filename or os.path.basename(source_path),
+            "total_rows": None,
+            "rows_done": 0,
+            "results_bytes": 0,
+            "input_bytes": 0,
+            "created_at": datetime.now().isoformat(),
+            "started_at": None,
+            "finished_at": None,
+            "error": None,
+        }
+        self._write_state(job_id, state)
+        self.executor.submit(_run_job, self.jobs_dir, job_id, self.chunk_size)
+        return self.get_status(job_id)
+
+    def get_status(self, job_id: str) -> Optional[Dict[str, Any]]:
+        """Return the job state with derived progress and ETA, or None if unknown"""
+        state = self._read_state(job_id)
+        if state is None:
+            return None
+
+        total = state["total_rows"]
+        done = state["rows_done"]
+        progress = done / total if total else (1.0 if state["status"] == "completed" else 0.0)
+
+        eta_seconds = None
+        session_start = state.get("session_started_at")
+        session_rows = done - state.get("session_rows_start", 0)
+        if state["status"] == "running" and total and session_start and session_rows > 0:
+            elapsed = time.time() - session_start
+            eta_seconds = round((total - done) * elapsed / session_rows, 1)
+
+        return {
+            "job_id": job_id,
+            "status": state["status"],
+            "source": state["source"],
+            "rows_done": done,
+            "total_rows": total,
+            "progress": round(progress, 4),
+            "eta_seconds": eta_seconds,
+            "created_at": state["created_at"],
+            "started_at": state["started_at"],
+            "finished_at": state["finished_at"],
+            "error": state["error"],
+        }
+
+    def results_path(self, job_id: str) -> str:
+        return os.path.join(self._job_dir(job_id), "results.csv")
+
+    def _job_dir(self, job_id: str) -> str:
+        return os.path.join(self.jobs_dir, job_id)
+
+    def _update_state(self, job_id: str, **changes) -> Dict[str, Any]:
+        with self._lock:
+            return _update_state(self.jobs_dir, job_id, **changes)
+
+    def _read_state(self, job_id: str) -> Optional[Dict[str, Any]]:
+        return _read_state(self.jobs_dir, job_id)
+
+    def _write_state(self, job_id: str, state: Dict[str, Any]):
+        _write_state(self.jobs_dir, job_id, state)
+
+    def _all_states(self) -> List[Dict[str, Any]]:
+        states = []
+        for job_id in os.listdir(self.jobs_dir):
+            state = self._read_state(job_id)
+            if state is not None:
+                states.append(state)
+        return states
+
+
+# Per-process state of scoring workers, set by _init_worker
+_worker_predictor = None
+_worker_stopping = None
+
+
+def _init_worker(stopping, nice: int):
+    """Load a single-threaded predictor into a freshly started worker process"""
+    global _worker_predictor, _worker_stopping
+    if nice:
+        os.nice(nice)
+    _worker_stopping = stopping
+    _worker_predictor = TitanicPredictor()
+    if _worker_predictor.load_model():
+        # One core per job; the forest's n_jobs=-1 would take every core
+        _worker_predictor.model.n_jobs = 1
+
+
+def _run_job(jobs_dir: str, job_id: str, chunk_size: int):
+    """Score a job's input chunk by chunk, persisting progress after each chunk"""
+    if _worker_stopping.is_set():
+        return
+
+    state = _read_state(jobs_dir, job_id)
+    input_path = os.path.join(jobs_dir, job_id, "input.csv")
+    results_path = os.path.join(jobs_dir, job_id, "results.csv")
+
+    try:
+        if state["total_rows"] is None:
+            state["total_rows"] = sum(
+                len(chunk) for chunk in pd.read_csv(input_path, usecols=[0], chunksize=chunk_size * 10)
+            )
+
+        rows_done = state["rows_done"]
+        input_bytes = state.get("input_bytes")
+        if input_bytes is None:
+            # State written before input offsets were tracked; score from the start
+            rows_done, input_bytes = 0, 0
+        state = _update_state(
+            jobs_dir,
+            job_id,
+            status="running",
+            total_rows=state["total_rows"],
+            rows_done=rows_done,
+            results_bytes=state["results_bytes"] if rows_done else 0,
+            input_bytes=input_bytes,
+            started_at=state["started_at"] or datetime.now().isoformat(),
+            session_started_at=time.time(),
+            session_rows_start=rows_done,
+        )
+
+        # Drop any chunk written after the last persisted state
+        if os.path.exists(results_path):
+            with open(results_path, "r+b") as f:
+                f.truncate(state["results_bytes"])
+
+        columns = pd.read_csv(input_path, nrows=0).columns
+        with open(input_path, "rb") as input_file:
+            # Seek past the header and every scored row without re-reading them
+            if input_bytes:
+                input_file.seek(input_bytes)
+            else:
+                input_file.readline()
+
+            while True:
+                if _worker_stopping.is_set():
+                    # Left as "running" on disk so the next start() resumes it
+                    return
+
+                lines = list(islice(input_file, chunk_size))
+                if not lines:
+                    break
+                input_bytes = input_file.tell()
+
+                chunk = pd.read_csv(io.BytesIO(b"".join(lines)), header=None, names=columns)
+                if chunk.empty:
+                    _update_state(jobs_dir, job_id, input_bytes=input_bytes)
+                    continue
+
+                chunk.index = range(rows_done, rows_done + len(chunk))
+                results = _worker_predictor.predict_survival_batch(chunk)
+                results.index.name = "row"
+
+                with open(results_path, "a", newline="") as f:
+                    results.to_csv(f, header=(rows_done == 0))
+                results_bytes = os.path.getsize(results_path)
+
+                rows_done += len(chunk)
+                _update_state(jobs_dir, job_id, rows_done=rows_done,
+                              results_bytes=results_bytes, input_bytes=input_bytes)
+
+        # Inputs without rows still get a header-only results file
+        if not os.path.exists(results_path):
+            pd.DataFrame(columns=RESULT_COLUMNS).to_csv(results_path, index=False)
+
+        _update_state(jobs_dir, job_id, status="completed", finished_at=datetime.now().isoformat())
+
+    except Exception as e:
+        print(f"Scoring job {job_id} failed: {str(e)}")
+        _update_state(jobs_dir, job_id, status="failed", error=str(e),
+                      finished_at=datetime.now().isoformat())
+
+
+def _state_path(jobs_dir: str, job_id: str) -> str:
+    return os.path.join(jobs_dir, job_id, "state.json")
+
+
+def _read_state(jobs_dir: str, job_id: str) -> Optional[Dict[str, Any]]:
+    # Job ids are uuid4 hex strings; anything else never maps to a job directory
+    if not job_id.isalnum():
+        return None
+    try:
+        with open(_state_path(jobs_dir, job_id)) as f:
+            return json.load(f)
+    except (FileNotFoundError, json.JSONDecodeError):
+        return None
+
+
+def _write_state(jobs_dir: str, job_id: str, state: Dict[str, Any]):
+    tmp_path = _state_path(jobs_dir, job_id) + ".tmp"
+    with open(tmp_path, "w") as f:
+        json.dump(state, f)
+    os.replace(tmp_path, _state_path(jobs_dir, job_id))
+
+
+def _update_state(jobs_dir: str, job_id: str, **changes) -> Dict[str, Any]:
+    """Read-modify-write a job's state; each job has one writer at a time"""
+    state = _read_state(jobs_dir, job_id)
+    state.update(changes)
+    _write_state(jobs_dir, job_id, state)
+    return state
@@ -1,16 +1,28 @@
-from fastapi import FastAPI, HTTPException, status
+from fastapi import FastAPI, HTTPException, status, File, Form, UploadFile
 from fastapi.middleware.cors import CORSMiddleware
-from fastapi.responses import JSONResponse
+from fastapi.responses import JSONResponse, FileResponse
 import uvicorn
 from datetime import datetime
+import math
 import os
 import sys
+from typing import List, Optional
 
 # Add src to path for imports
 sys.path.append(os.path.dirname(os.path.abspath(__file__)))
 
-from models import PassengerData, SurvivalPrediction, HealthCheck, ErrorResponse
+from models import (
+    PassengerData, SurvivalPrediction, SweepAxis, SweepRequest, SweepPoint, SweepResponse,
+    HealthCheck, JobStatus, ErrorResponse
+)
 from predictor import TitanicPredictor
+from jobs import JobManager
+
+# Directory that POST /jobs may reference input files from
+JOBS_INPUT_DIR = os.getenv("JOBS_INPUT_DIR", "data")
+
+# Largest number of grid points a single sweep may evaluate
+SWEEP_MAX_GRID_SIZE = int(os.getenv("SWEEP_MAX_GRID_SIZE", "10000"))
 
 # Initialize FastAPI app
 app = FastAPI(
@@ -33,12 +45,24 @@ app.add_middleware(
 # Initialize predictor
 predictor = TitanicPredictor()
 
+# Batch scoring jobs run in separate low-priority worker processes so /predict stays responsive
+job_manager = JobManager()
+
 @app.on_event("startup")
 async def startup_event():
     """Load the model on startup"""
     success = predictor.load_model()
     if not success:
         print("Warning: Model could not be loaded")
+    
+    resumed = job_manager.start()
+    if resumed:
+        print(f"Resumed {len(resumed)} unfinished scoring job(s)")
+
+@app.on_event("shutdown")
+async def shutdown_event():
+    """Stop scoring jobs; unfinished jobs resume on next startup"""
+    job_manager.shutdown()
 
 @app.get("/", response_model=dict)
 async def root():
@@ -48,7 +72,9 @@ async def root():
         "version": "1.0.0",
         "docs": "/docs",
         "health": "/health",
-        "predict": "/predict"
+        "predict": "/predict",
+        "sweep": "/predict/sweep",
+        "jobs": "/jobs"
     }
 
 @app.get("/health", response_model=HealthCheck)
@@ -61,8 +87,12 @@ async def health_check():
     )
 
 @app.post("/predict", response_model=SurvivalPrediction)
-async def predict_survival(passenger: PassengerData):
-    """Predict survival probability for a passenger"""
+async def predict_survival(passenger: PassengerData, early_exit: bool = False):
+    """Predict survival probability for a passenger
+    
+    With early_exit, tree evaluation stops once the forest vote can no longer
+    change the class or confidence level; the probability is then an estimate.
+    """
     if not predictor.is_loaded:
         raise HTTPException(
             status_code=status.HTTP_503_SERVICE_UNAVAILABLE,
@@ -71,12 +101,17 @@ async def predict_survival(passenger: PassengerData):
     
     try:
         passenger_dict = passenger.dict()
-        survived, probability, confidence = predictor.predict_survival(passenger_dict)
+        if early_exit:
+            survived, probability, confidence, trees_evaluated = predictor.predict_survival_early_exit(passenger_dict)
+        else:
+            survived, probability, confidence = predictor.predict_survival(passenger_dict)
+            trees_evaluated = len(predictor.model.estimators_)
         
         return SurvivalPrediction(
             survived=survived,
             survival_probability=probability,
-            confidence=confidence
+            confidence=confidence,
+            trees_evaluated=trees_evaluated
         )
     except Exception as e:
         raise HTTPException(
@@ -84,6 +119,145 @@ async def predict_survival(passenger: PassengerData):
             detail=f"Prediction failed: {str(e)}"
         )
 
+def sweep_axis_values(axis: SweepAxis) -> List[float]:
+    """Expand a sweep axis to its list of values"""
+    has_range = any(v is not None for v in (axis.start, axis.stop, axis.step))
+    if (axis.values is not None) == has_range:
+        raise HTTPException(
+            status_code=status.HTTP_400_BAD_REQUEST,
+            detail=f"Axis '{axis.feature}' needs either 'values' or 'start', 'stop' and 'step'"
+        )
+    
+    if axis.values is not None:
+        return axis.values
+    
+    if axis.start is None or axis.stop is None or axis.step is None or axis.stop < axis.start:
+        raise HTTPException(
+            status_code=status.HTTP_400_BAD_REQUEST,
+            detail=f"Axis '{axis.feature}' needs 'start' <= 'stop' and a 'step'"
+        )
+    
+    # Huge ranges or tiny steps overflow the span to infinity, which cannot be floored
+    span = (axis.stop - axis.start) / axis.step
+    if not math.isfinite(span) or math.floor(span + 1e-9) + 1 > SWEEP_MAX_GRID_SIZE:
+        raise HTTPException(
+            status_code=status.HTTP_400_BAD_REQUEST,
+            detail=f"Sweep grid exceeds {SWEEP_MAX_GRID_SIZE} points"
+        )
+    
+    count = math.floor(span + 1e-9) + 1
+    return [round(axis.start + i * axis.step, 10) for i in range(count)]
+
+@app.post("/predict/sweep", response_model=SweepResponse)
+async def predict_sweep(request: SweepRequest):
+    """Predict survival over a grid of values for one or two passenger features"""
+    if not predictor.is_loaded:
+        raise HTTPException(
+            status_code=status.HTTP_503_SERVICE_UNAVAILABLE,
+            detail="Model not loaded"
+        )
+    
+    axes = [(axis.feature, sweep_axis_values(axis)) for axis in request.axes]
+    if math.prod(len(values) for _, values in axes) > SWEEP_MAX_GRID_SIZE:
+        raise HTTPException(
+            status_code=status.HTTP_400_BAD_REQUEST,
+            detail=f"Sweep grid exceeds {SWEEP_MAX_GRID_SIZE} points"
+        )
+    
+    try:
+        grid = predictor.sweep_survival(request.passenger.dict(), axes)
+    except ValueError as e:
+        raise HTTPException(
+            status_code=status.HTTP_400_BAD_REQUEST,
+            detail=str(e)
+        )
+    except Exception as e:
+        raise HTTPException(
+            status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
+            detail=f"Sweep failed: {str(e)}"
+        )
+    
+    features = [feature for feature, _ in axes]
+    points = [
+        SweepPoint(
+            values={feature: row[feature] for feature in features},
+            survived=row['survived'],
+            survival_probability=row['survival_probability'],
+            confidence=row['confidence']
+        )
+        for row in grid.to_dict('records')
+    ]
+    return SweepResponse(features=features, grid_size=len(points), points=points)
+
+@app.post("/jobs", response_model=JobStatus, status_code=status.HTTP_202_ACCEPTED)
+def create_job(file: Optional[UploadFile] = File(None), input_path: Optional[str] = Form(None)):
+    """Submit a CSV of passengers for asynchronous scoring
+    
+    Either upload the CSV as ``file`` or reference a file under the jobs input
+    directory with ``input_path``. Returns immediately with the queued job.
+    """
+    if not predictor.is_loaded:
+        raise HTTPException(
+            status_code=status.HTTP_503_SERVICE_UNAVAILABLE,
+            detail="Model not loaded"
+        )
+    
+    if (file is None) == (input_path is None):
+        raise HTTPException(
+            status_code=status.HTTP_400_BAD_REQUEST,
+            detail="Provide exactly one of 'file' or 'input_path'"
+        )
+    
+    if file is not None:
+        return job_manager.submit(fileobj=file.file, filename=file.filename)
+    
+    input_root = os.path.realpath(JOBS_INPUT_DIR)
+    source_path = os.path.realpath(os.path.join(input_root, input_path))
+    if not source_path.startswith(input_root + os.sep) or not os.path.isfile(source_path):
+        raise HTTPException(
+            status_code=status.HTTP_404_NOT_FOUND,
+            detail=f"Input file not found: {input_path}"
+        )
+    return job_manager.submit(source_path=source_path)
+
+@app.get("/jobs/{job_id}", response_model=JobStatus)
+async def get_job(job_id: str):
+    """Get progress of a batch scoring job"""
+    job = job_manager.get_status(job_id)
+    if job is None:
+        raise HTTPException(
+            status_code=status.HTTP_404_NOT_FOUND,
+            detail=f"Job not found: {job_id}"
+        )
+    return job
+
+@app.get("/jobs/{job_id}/results")
+async def download_job_results(job_id: str):
+    """Download the scored CSV of a completed job"""
+    job = job_manager.get_status(job_id)
+    if job is None:
+        raise HTTPException(
+            status_code=status.HTTP_404_NOT_FOUND,
+            detail=f"Job not found: {job_id}"
+        )
+    if job["status"] != "completed":
+        raise HTTPException(
+            status_code=status.HTTP_409_CONFLICT,
+            detail=f"Job is {job['status']}, results are not available"
+        )
+    
+    results_path = job_manager.results_path(job_id)
+    if not os.path.isfile(results_path):
+        raise HTTPException(
+            status_code=status.HTTP_404_NOT_FOUND,
+            detail=f"Results not found for job: {job_id}"
+        )
+    return FileResponse(
+        results_path,
+        media_type="text/csv",
+        filename=f"{job_id}.csv"
+    )
+
 @app.get("/model-info", response_model=dict)
 async def get_model_info():
     """Get information about the loaded model"""
@@ -1,5 +1,5 @@
 from pydantic import BaseModel, Field
-from typing import Optional
+from typing import Annotated, Dict, List, Optional
 
 class PassengerData(BaseModel):
     """Schema for passenger data input"""
@@ -18,6 +18,33 @@ class SurvivalPrediction(BaseModel):
     survived: bool = Field(..., description="Predicted survival (True=Survived, False=Did not survive)")
     survival_probability: float = Field(..., ge=0, le=1, description="Probability of survival")
     confidence: str = Field(..., description="Confidence level (High/Medium/Low)")
+    trees_evaluated: Optional[int] = Field(None, ge=1, description="Number of forest trees evaluated for this prediction")
+
+class SweepAxis(BaseModel):
+    """Schema for one swept feature, given as a list of values or a start/stop/step range"""
+    feature: str = Field(..., description="Feature to vary (age/fare/pclass/sibsp/parch)")
+    values: Optional[List[Annotated[float, Field(allow_inf_nan=False)]]] = Field(None, description="Explicit values to evaluate")
+    start: Optional[float] = Field(None, allow_inf_nan=False, description="First value of the range")
+    stop: Optional[float] = Field(None, allow_inf_nan=False, description="Last value of the range (inclusive)")
+    step: Optional[float] = Field(None, gt=0, allow_inf_nan=False, description="Range step")
+
+class SweepRequest(BaseModel):
+    """Schema for a what-if sensitivity sweep"""
+    passenger: PassengerData = Field(..., description="Base passenger")
+    axes: List[SweepAxis] = Field(..., min_length=1, max_length=2, description="One or two features to sweep")
+
+class SweepPoint(BaseModel):
+    """Schema for the prediction at one grid point of a sweep"""
+    values: Dict[str, float] = Field(..., description="Swept feature values at this point")
+    survived: bool = Field(..., description="Predicted survival (True=Survived, False=Did not survive)")
+    survival_probability: float = Field(..., ge=0, le=1, description="Probability of survival")
+    confidence: str = Field(..., description="Confidence level (High/Medium/Low)")
+
+class SweepResponse(BaseModel):
+    """Schema for sweep response"""
+    features: List[str] = Field(..., description="Swept features, in axis order")
+    grid_size: int = Field(..., description="Number of grid points")
+    points: List[SweepPoint] = Field(..., description="Predictions, last axis varying fastest")
 
 class HealthCheck(BaseModel):
     """Schema for health check response"""
@@ -25,6 +52,20 @@ class HealthCheck(BaseModel):
     model_loaded: bool = Field(..., description="Whether the model is loaded")
     timestamp: str = Field(..., description="Current timestamp")
 
+class JobStatus(BaseModel):
+    """Schema for batch scoring job status"""
+    job_id: str = Field(..., description="Job identifier")
+    status: str = Field(..., description="Job status (queued/running/completed/failed)")
+    source: str = Field(..., description="Name of the input file")
+    rows_done: int = Field(..., ge=0, description="Number of rows scored so far")
+    total_rows: Optional[int] = Field(None, ge=0, description="Total number of rows in the input file")
+    progress: float = Field(..., ge=0, le=1, description="Fraction of rows scored")
+    eta_seconds: Optional[float] = Field(None, ge=0, description="Estimated seconds until completion")
+    created_at: str = Field(..., description="Submission timestamp")
+    started_at: Optional[str] = Field(None, description="Timestamp when scoring started")
+    finished_at: Optional[str] = Field(None, description="Timestamp when the job completed or failed")
+    error: Optional[str] = Field(None, description="Failure reason for failed jobs")
+
 class ErrorResponse(BaseModel):
     """Schema for error responses"""
     error: str = Field(..., description="Error message")
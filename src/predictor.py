@@ -1,9 +1,43 @@
 import joblib
 import numpy as np
 import pandas as pd
-from typing import Dict, Any, Tuple
+from typing import Dict, Any, List, Tuple
 import os
 
+REQUIRED_PASSENGER_COLUMNS = ['pclass', 'sex', 'age', 'sibsp', 'parch', 'fare', 'embarked']
+
+# Fill values train_model.preprocess_data used for missing Age and Embarked in data/titanic.csv
+TRAINING_AGE_MEDIAN = 28.0
+TRAINING_EMBARKED_MODE = 'S'
+
+# Features a what-if sweep can vary: model column, (min, max) bounds and whether values must be integers
+SWEEP_FEATURES = {
+    'age': ('Age', (0, 100), False),
+    'fare': ('Fare', (0, None), False),
+    'pclass': ('Pclass', (1, 3), True),
+    'sibsp': ('SibSp', (0, None), True),
+    'parch': ('Parch', (0, None), True),
+}
+
+# Slack for float rounding when comparing partial-vote bounds against band edges
+EARLY_EXIT_EPSILON = 1e-9
+
+# Widest prediction band; a partial vote can only be decided once fewer trees than this fraction remain
+MAX_BAND_WIDTH = 0.2
+
+# Trees evaluated between early-exit bound checks once a row could be decided
+EARLY_EXIT_BLOCK_SIZE = 10
+
+def _prediction_band(survival_prob: np.ndarray) -> np.ndarray:
+    """Index of the (confidence level, class) band each probability falls in
+    
+    Bands in increasing probability: High/False, Medium/False, Low/False,
+    Low/True, Medium/True, High/True. Two probabilities in the same band get the
+    same confidence level from confidence_level() and the same predicted class.
+    """
+    return ((survival_prob >= 0.2).astype(int) + (survival_prob >= 0.4)
+            + (survival_prob > 0.5) + (survival_prob > 0.6) + (survival_prob > 0.8))
+
 class TitanicPredictor:
     """Service class for making Titanic survival predictions"""
     
@@ -12,6 +46,7 @@ class TitanicPredictor:
         self.label_encoders = None
         self.scaler = None
         self.feature_names = None
+        self.packed_forest = None
         self.is_loaded = False
         
     def load_model(self, model_path: str = "models/titanic_model.pkl"):
@@ -25,6 +60,8 @@ class TitanicPredictor:
             self.scaler = joblib.load("models/scaler.pkl")
             self.feature_names = joblib.load("models/feature_names.pkl")
             self.is_loaded = True
+            
+            self._prepare_early_exit()
             return True
             
         except Exception as e:
@@ -34,97 +71,7 @@ class TitanicPredictor:
     
     def preprocess_passenger_data(self, passenger_data: Dict[str, Any]) -> np.ndarray:
         """Preprocess passenger data for prediction"""
-        try:
-            # Convert to DataFrame with proper column names
-            df_data = {
-                'Pclass': passenger_data.get('pclass'),
-                'Sex': passenger_data.get('sex'),
-                'Age': passenger_data.get('age'),
-                'SibSp': passenger_data.get('sibsp'),
-                'Parch': passenger_data.get('parch'),
-                'Fare': passenger_data.get('fare'),
-                'Embarked': passenger_data.get('embarked'),
-                'Name': passenger_data.get('name'),
-                'Cabin': passenger_data.get('cabin')
-            }
-            
-            print(f"Input data: {df_data}")
-            
-            df = pd.DataFrame([df_data])
-            
-            # Extract title from Name
-            if df['Name'].iloc[0]:
-                title_match = df['Name'].str.extract(' ([A-Za-z]+)\.', expand=False).iloc[0]
-                print(f"Extracted title: {title_match}")
-                
-                # Handle NaN values
-                if pd.isna(title_match):
-                    df['Title'] = 'Mr'
-                else:
-                    title = str(title_match)
-                    # Map uncommon titles to common ones
-                    if title in ['Capt', 'Col', 'Major', 'Dr', 'Rev']:
-                        df['Title'] = 'Mr'
-                    elif title in ['Mlle', 'Ms']:
-                        df['Title'] = 'Miss'
-                    elif title == 'Mme':
-                        df['Title'] = 'Mrs'
-                    else:
-                        df['Title'] = title
-            else:
-                df['Title'] = 'Mr'
-            
-            # Create family size feature
-            df['FamilySize'] = df['SibSp'] + df['Parch'] + 1
-            df['IsAlone'] = (df['FamilySize'] == 1).astype(int)
-            
-            # Extract deck from Cabin
-            if df['Cabin'].iloc[0]:
-                df['Deck'] = df['Cabin'].str[0]
-            else:
-                df['Deck'] = 'Unknown'
-            
-            # Select features for model
-            features = ['Pclass', 'Sex', 'Age', 'SibSp', 'Parch', 'Fare', 'Embarked', 
-                        'Title', 'FamilySize', 'IsAlone', 'Deck']
-            
-            X = df[features].copy()
-            print(f"Features before encoding: {X.to_dict('records')[0]}")
-            
-            # Encode categorical variables
-            categorical_features = ['Sex', 'Embarked', 'Title', 'Deck']
-            
-            for feature in categorical_features:
-                if feature in self.label_encoders:
-                    try:
-                        unique_values = self.label_encoders[feature].classes_
-                        value = X[feature].iloc[0]
-                        print(f"Encoding {feature}: {value} (available: {unique_values})")
-                        
-                        if value not in unique_values:
-                            # Use the most common value as fallback
-                            X[feature] = unique_values[0]
-                            print(f"  -> Using fallback: {unique_values[0]}")
-                        else:
-                            X[feature] = self.label_encoders[feature].transform([value])[0]
-                            print(f"  -> Encoded as: {X[feature].iloc[0]}")
-                    except Exception as e:
-                        print(f"Error encoding {feature}: {e}")
-                        # Use the first available value as fallback
-                        X[feature] = 0
-            
-            print(f"Features after encoding: {X.to_dict('records')[0]}")
-            
-            # Scale numerical features
-            numerical_features = ['Age', 'Fare', 'FamilySize']
-            X[numerical_features] = self.scaler.transform(X[numerical_features])
-            
-            print(f"Final features: {X.values[0]}")
-            return X.values
-            
-        except Exception as e:
-            print(f"Error in preprocessing: {e}")
-            raise
+        return self.preprocess_passenger_frame(pd.DataFrame([passenger_data]))
     
     def predict_survival(self, passenger_data: Dict[str, Any]) -> Tuple[bool, float, str]:
         """Predict survival probability and return result with confidence"""
@@ -137,16 +84,267 @@ class TitanicPredictor:
         probability = self.model.predict_proba(X)[0]
         
         survival_prob = probability[1] if len(probability) > 1 else probability[0]
+        confidence = self.confidence_level(survival_prob)
         
-        # Determine confidence level
+        return bool(prediction), float(survival_prob), confidence
+    
+    @staticmethod
+    def confidence_level(survival_prob: float) -> str:
+        """Map a survival probability to its confidence level"""
         if survival_prob > 0.8 or survival_prob < 0.2:
-            confidence = "High"
+            return "High"
         elif survival_prob > 0.6 or survival_prob < 0.4:
-            confidence = "Medium"
-        else:
-            confidence = "Low"
+            return "Medium"
+        return "Low"
+    
+    def _prepare_early_exit(self):
+        """Pack all trees into flat node arrays for vectorized early-exit inference
         
-        return bool(prediction), float(survival_prob), confidence
+        Node ids are offset per tree so the whole forest can be traversed with a
+        few numpy operations per depth level instead of one tree_.apply call per
+        tree. Leaves point to themselves, so traversal can run a fixed number of
+        steps. Each node carries its normalized survival probability, which is
+        exactly what DecisionTreeClassifier.predict_proba returns at a leaf.
+        """
+        classes = list(self.model.classes_)
+        survival_index = classes.index(1) if len(classes) > 1 else 0
+        trees = [estimator.tree_ for estimator in self.model.estimators_]
+        offsets = np.cumsum([0] + [tree.node_count for tree in trees[:-1]])
+        
+        left, right, feature, threshold, survival = [], [], [], [], []
+        for tree, offset in zip(trees, offsets):
+            nodes = np.arange(tree.node_count)
+            is_leaf = tree.children_left == -1
+            left.append(np.where(is_leaf, nodes, tree.children_left) + offset)
+            right.append(np.where(is_leaf, nodes, tree.children_right) + offset)
+            feature.append(np.where(is_leaf, 0, tree.feature))
+            threshold.append(tree.threshold)
+            value = tree.value[:, 0, :]
+            survival.append(value[:, survival_index] / value.sum(axis=1))
+        
+        self.packed_forest = {
+            'roots': offsets,
+            'left': np.concatenate(left),
+            'right': np.concatenate(right),
+            'feature': np.concatenate(feature),
+            'threshold': np.concatenate(threshold),
+            'survival': np.concatenate(survival),
+            'max_depth': max(tree.max_depth for tree in trees),
+        }
+    
+    def _forest_survival_sum(self, X: np.ndarray, first_tree: int, last_tree: int) -> np.ndarray:
+        """Sum of survival probabilities of trees [first_tree, last_tree) for each row of X"""
+        forest = self.packed_forest
+        nodes = np.repeat(forest['roots'][first_tree:last_tree, None], X.shape[0], axis=1)
+        rows = np.arange(X.shape[0])
+        for _ in range(forest['max_depth']):
+            # float32 features against float64 thresholds, as in sklearn's tree traversal
+            go_left = X[rows, forest['feature'][nodes]] <= forest['threshold'][nodes]
+            nodes = np.where(go_left, forest['left'][nodes], forest['right'][nodes])
+        return forest['survival'][nodes].sum(axis=0)
+    
+    def predict_proba_early_exit(self, X: np.ndarray) -> Tuple[np.ndarray, np.ndarray]:
+        """Survival probabilities from a forest vote that stops once its outcome is decided
+        
+        After k of n trees with survival votes summing to S, the full-forest
+        probability must lie in [S/n, (S + n - k)/n]. A row stops as soon as that
+        whole interval sits inside one prediction band, so its confidence level and
+        class are guaranteed to match full evaluation. The returned probability is
+        the partial mean S/k clipped into that interval.
+        
+        No band is wider than MAX_BAND_WIDTH, so no row can stop while that
+        fraction of trees or more remains: at most about a fifth of the forest is
+        ever skipped. The trees every row needs are evaluated in one block, then
+        the bound is checked after each EARLY_EXIT_BLOCK_SIZE further trees.
+        
+        Returns the probabilities and the number of trees evaluated per row.
+        """
+        X = np.ascontiguousarray(X, dtype=np.float32)
+        n_rows = X.shape[0]
+        n_trees = len(self.packed_forest['roots'])
+        
+        # Largest number of remaining trees whose bound interval can fit in a band
+        max_skippable = max(int(np.ceil(MAX_BAND_WIDTH * n_trees)) - 1, 0)
+        checkpoints = list(range(n_trees - max_skippable, n_trees, EARLY_EXIT_BLOCK_SIZE)) + [n_trees]
+        
+        vote_sum = np.zeros(n_rows)
+        survival_prob = np.zeros(n_rows)
+        trees_evaluated = np.full(n_rows, n_trees)
+        active = np.arange(n_rows)
+        evaluated = 0
+        
+        for k in checkpoints:
+            vote_sum[active] += self._forest_survival_sum(X[active], evaluated, k)
+            evaluated = k
+            
+            remaining = n_trees - k
+            low = vote_sum[active] / n_trees
+            high = (vote_sum[active] + remaining) / n_trees
+            if remaining == 0:
+                decided = np.ones(len(active), dtype=bool)
+            else:
+                decided = (_prediction_band(low - EARLY_EXIT_EPSILON)
+                           == _prediction_band(high + EARLY_EXIT_EPSILON))
+            
+            finished = active[decided]
+            survival_prob[finished] = np.clip(vote_sum[finished] / k, low[decided], high[decided])
+            trees_evaluated[finished] = k
+            
+            active = active[~decided]
+            if len(active) == 0:
+                break
+        
+        return survival_prob, trees_evaluated
+    
+    def predict_survival_early_exit(self, passenger_data: Dict[str, Any]) -> Tuple[bool, float, str, int]:
+        """Predict survival with early-exit tree evaluation
+        
+        The class and confidence level match predict_survival; the probability is
+        an estimate. Also returns the number of trees evaluated.
+        """
+        if not self.is_loaded:
+            raise RuntimeError("Model not loaded")
+        
+        X = self.preprocess_passenger_data(passenger_data)
+        survival_prob, trees_evaluated = self.predict_proba_early_exit(X.astype(float))
+        
+        prob = float(survival_prob[0])
+        return prob > 0.5, prob, self.confidence_level(prob), int(trees_evaluated[0])
+    
+    def preprocess_passenger_frame(self, passengers: pd.DataFrame) -> np.ndarray:
+        """Preprocess a batch of passengers (one row each, PassengerData column names)
+        
+        The single encoder behind every prediction path (/predict, batch jobs and
+        sweeps); it reproduces the encoding of train_model.preprocess_data.
+        Column names are matched case-insensitively, so the raw Titanic CSV
+        layout is accepted as-is. Missing values get the training-time defaults.
+        """
+        df = passengers.rename(columns=str.lower)
+        missing = [c for c in REQUIRED_PASSENGER_COLUMNS if c not in df.columns]
+        if missing:
+            raise ValueError(f"Missing required columns: {', '.join(missing)}")
+        
+        X = pd.DataFrame(index=df.index)
+        X['Pclass'] = df['pclass'].astype(int)
+        X['Sex'] = df['sex'].astype(str).str.lower()
+        X['Age'] = pd.to_numeric(df['age'], errors='coerce').fillna(TRAINING_AGE_MEDIAN)
+        X['SibSp'] = df['sibsp'].fillna(0).astype(int)
+        X['Parch'] = df['parch'].fillna(0).astype(int)
+        X['Fare'] = pd.to_numeric(df['fare'], errors='coerce').fillna(self.scaler.mean_[1])
+        X['Embarked'] = df['embarked'].fillna(TRAINING_EMBARKED_MODE).replace('', TRAINING_EMBARKED_MODE)
+        
+        # Extract title from Name; titles the encoder has not seen are mapped to common ones
+        names = df['name'] if 'name' in df.columns else pd.Series(None, index=df.index, dtype=object)
+        titles = names.astype('string').str.extract(r' ([A-Za-z]+)\.', expand=False)
+        known_titles = self.label_encoders['Title'].classes_ if 'Title' in self.label_encoders else []
+        mapped_titles = titles.replace({
+            'Capt': 'Mr', 'Col': 'Mr', 'Major': 'Mr', 'Dr': 'Mr', 'Rev': 'Mr',
+            'Mlle': 'Miss', 'Ms': 'Miss', 'Mme': 'Mrs'
+        })
+        X['Title'] = titles.where(titles.isin(known_titles), mapped_titles).fillna('Mr')
+        
+        X['FamilySize'] = X['SibSp'] + X['Parch'] + 1
+        X['IsAlone'] = (X['FamilySize'] == 1).astype(int)
+        
+        # Extract deck from Cabin, a missing cabin is 'Unknown' i.e. deck 'U' as in training
+        cabins = df['cabin'] if 'cabin' in df.columns else pd.Series(None, index=df.index, dtype=object)
+        cabins = cabins.astype('string').replace('', pd.NA).fillna('Unknown')
+        X['Deck'] = cabins.str[0]
+        
+        features = ['Pclass', 'Sex', 'Age', 'SibSp', 'Parch', 'Fare', 'Embarked', 
+                    'Title', 'FamilySize', 'IsAlone', 'Deck']
+        X = X[features]
+        
+        # Encode categorical variables, unseen values fall back to the first class
+        categorical_features = ['Sex', 'Embarked', 'Title', 'Deck']
+        for feature in categorical_features:
+            if feature in self.label_encoders:
+                classes = self.label_encoders[feature].classes_
+                codes = pd.Index(classes).get_indexer(X[feature].astype(str))
+                X[feature] = np.where(codes < 0, 0, codes)
+        
+        # Scale numerical features
+        numerical_features = ['Age', 'Fare', 'FamilySize']
+        X[numerical_features] = self.scaler.transform(X[numerical_features])
+        
+        return X.values.astype(float)
+    
+    def predict_survival_batch(self, passengers: pd.DataFrame) -> pd.DataFrame:
+        """Predict survival for a batch of passengers in a single model call"""
+        if not self.is_loaded:
+            raise RuntimeError("Model not loaded")
+        
+        X = self.preprocess_passenger_frame(passengers)
+        probability = self.model.predict_proba(X)
+        survival_prob = probability[:, 1] if probability.shape[1] > 1 else probability[:, 0]
+        
+        return pd.DataFrame({
+            'survived': survival_prob > 0.5,
+            'survival_probability': survival_prob,
+            'confidence': [self.confidence_level(p) for p in survival_prob]
+        }, index=passengers.index)
+    
+    def _scale_column(self, feature: str, values: np.ndarray) -> np.ndarray:
+        """Apply the stored scaler to a single numerical column"""
+        i = ['Age', 'Fare', 'FamilySize'].index(feature)
+        return (values - self.scaler.mean_[i]) / self.scaler.scale_[i]
+    
+    def sweep_survival(self, passenger_data: Dict[str, Any], axes: List[Tuple[str, List[float]]]) -> pd.DataFrame:
+        """Predict survival over a grid of values for one or more passenger features
+        
+        The base passenger is encoded once and broadcast to one row per grid point.
+        Only the swept columns (and FamilySize/IsAlone when sibsp or parch vary)
+        are recomputed, and the whole grid is scored in a single model call.
+        
+        Returns one row per grid point with the swept values and the prediction.
+        """
+        if not self.is_loaded:
+            raise RuntimeError("Model not loaded")
+        
+        features = [feature for feature, _ in axes]
+        if len(set(features)) != len(features):
+            raise ValueError("Each feature can only be swept once")
+        
+        for feature, values in axes:
+            if feature not in SWEEP_FEATURES:
+                raise ValueError(f"Cannot sweep '{feature}', expected one of: {', '.join(SWEEP_FEATURES)}")
+            _, (low, high), integer = SWEEP_FEATURES[feature]
+            values = np.asarray(values, dtype=float)
+            if len(values) == 0:
+                raise ValueError(f"No values to sweep for '{feature}'")
+            if values.min() < low or (high is not None and values.max() > high):
+                raise ValueError(f"Values for '{feature}' must be within [{low}, {high if high is not None else 'inf'}]")
+            if integer and not np.all(values == np.round(values)):
+                raise ValueError(f"Values for '{feature}' must be integers")
+        
+        mesh = np.meshgrid(*[np.asarray(values, dtype=float) for _, values in axes], indexing='ij')
+        grid = pd.DataFrame({feature: values.ravel() for feature, values in zip(features, mesh)})
+        
+        base = self.preprocess_passenger_frame(pd.DataFrame([passenger_data]))
+        X = np.repeat(base, len(grid), axis=0)
+        columns = {name: i for i, name in enumerate(self.feature_names)}
+        
+        for feature in features:
+            column = SWEEP_FEATURES[feature][0]
+            values = grid[feature].to_numpy()
+            if column in ('Age', 'Fare'):
+                values = self._scale_column(column, values)
+            X[:, columns[column]] = values
+        
+        if 'sibsp' in features or 'parch' in features:
+            sibsp = grid['sibsp'].to_numpy() if 'sibsp' in features else passenger_data['sibsp']
+            parch = grid['parch'].to_numpy() if 'parch' in features else passenger_data['parch']
+            family_size = sibsp + parch + 1
+            X[:, columns['FamilySize']] = self._scale_column('FamilySize', family_size)
+            X[:, columns['IsAlone']] = (family_size == 1).astype(int)
+        
+        probability = self.model.predict_proba(X)
+        survival_prob = probability[:, 1] if probability.shape[1] > 1 else probability[:, 0]
+        
+        grid['survived'] = survival_prob > 0.5
+        grid['survival_probability'] = survival_prob
+        grid['confidence'] = [self.confidence_level(p) for p in survival_prob]
+        return grid
     
     def get_model_info(self) -> Dict[str, Any]:
         """Get information about the loaded model"""
@@ -157,6 +355,7 @@ class TitanicPredictor:
             "status": "Model loaded",
             "model_type": type(self.model).__name__,
             "feature_count": len(self.feature_names),
-            "features": self.feature_names
+            "features": self.feature_names,
+            "tree_count": len(self.model.estimators_)
         } # Added prediction functionality - Mon Jun 30 21:53:40 CEST 2025
 # Enhanced input validation - Mon Jun 30 21:53:41 CEST 2025
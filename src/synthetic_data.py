@@ -0,0 +1,93 @@
+import argparse
+import os
+
+import numpy as np
+import pandas as pd
+
+REFERENCE_DATA_PATH = "data/titanic.csv"
+
+def load_reference_data(data_path=REFERENCE_DATA_PATH):
+    """Load the real Titanic dataset used as the template for synthetic rows"""
+    reference = pd.read_csv(data_path)
+    # Split "Surname, Title. Given names" once so rows can be recombined cheaply
+    name_parts = reference['Name'].str.split(', ', n=1, expand=True)
+    reference['_Surname'] = name_parts[0]
+    reference['_TitleAndGiven'] = name_parts[1]
+    return reference
+
+def generate_passengers(reference, n_rows, rng, start_id=1):
+    """Generate n_rows synthetic passengers in the layout of data/titanic.csv
+
+    Every synthetic row is a perturbed copy of a randomly drawn real passenger,
+    so the joint distribution of the categorical fields is kept exactly:
+    Pclass/Fare/Cabin deck, Title/Sex/Age, family size, port and outcome all
+    come from the same template row. Only the continuous and identifying fields
+    are perturbed:
+
+    - Age and Fare are scaled by a small log-normal factor (children stay
+      children, fares stay within their class band, missing values stay missing)
+    - Cabin keeps its deck letter with a new cabin number
+    - the surname is taken from another random passenger, while the title and
+      given names stay with the template row
+    """
+    template = reference.iloc[rng.integers(0, len(reference), size=n_rows)].reset_index(drop=True)
+    surnames = reference['_Surname'].to_numpy()[rng.integers(0, len(reference), size=n_rows)]
+
+    df = pd.DataFrame({
+        'PassengerId': np.arange(start_id, start_id + n_rows),
+        'Survived': template['Survived'].to_numpy(),
+        'Pclass': template['Pclass'].to_numpy(),
+        'Name': surnames + ', ' + template['_TitleAndGiven'].to_numpy(),
+        'Sex': template['Sex'].to_numpy(),
+    })
+
+    age = template['Age'].to_numpy() * np.exp(rng.normal(0, 0.08, size=n_rows))
+    age = np.clip(age, 0.17, 80)
+    df['Age'] = np.where(age < 1, np.round(age, 2), np.round(age))
+
+    df['SibSp'] = template['SibSp'].to_numpy()
+    df['Parch'] = template['Parch'].to_numpy()
+    df['Ticket'] = template['Ticket'].to_numpy()
+    df['Fare'] = np.round(template['Fare'].to_numpy() * np.exp(rng.normal(0, 0.05, size=n_rows)), 4)
+
+    decks = template['Cabin'].str[0]
+    cabin_numbers = pd.Series(rng.integers(1, 150, size=n_rows)).astype(str)
+    df['Cabin'] = (decks + cabin_numbers).where(decks.isin(list('ABCDEFG')), decks)
+
+    df['Embarked'] = template['Embarked'].to_numpy()
+    return df
+
+def write_synthetic_data(output_path, n_rows, seed=42, chunk_size=1_000_000,
+                         reference_path=REFERENCE_DATA_PATH):
+    """Write n_rows synthetic passengers to a CSV file, chunk_size rows at a time
+
+    Memory use is bounded by chunk_size, so arbitrarily large files can be
+    written. Output is fully determined by seed and chunk_size.
+    """
+    reference = load_reference_data(reference_path)
+    rng = np.random.default_rng(seed)
+
+    output_dir = os.path.dirname(output_path)
+    if output_dir:
+        os.makedirs(output_dir, exist_ok=True)
+
+    rows_written = 0
+    with open(output_path, 'w', newline='') as f:
+        while rows_written < n_rows:
+            size = min(chunk_size, n_rows - rows_written)
+            chunk = generate_passengers(reference, size, rng, start_id=rows_written + 1)
+            chunk.to_csv(f, index=False, header=(rows_written == 0))
+            rows_written += size
+
+    return output_path
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Generate synthetic Titanic passenger data")
+    parser.add_argument("rows", type=int, help="Number of rows to generate")
+    parser.add_argument("--output", default="data/synthetic_titanic.csv", help="Output CSV path")
+    parser.add_argument("--seed", type=int, default=42, help="Random seed")
+    parser.add_argument("--chunk-size", type=int, default=1_000_000, help="Rows generated per chunk")
+    args = parser.parse_args()
+
+    write_synthetic_data(args.output, args.rows, seed=args.seed, chunk_size=args.chunk_size)
+    print(f"Wrote {args.rows} synthetic rows to {args.output}")
@@ -64,6 +64,24 @@ def preprocess_data(df):
     
     return X, y, label_encoders, scaler
 
+def build_model():
+    """Create the (unfitted) survival classifier"""
+    return RandomForestClassifier(
+        n_estimators=100,
+        max_depth=10,
+        random_state=42,
+        n_jobs=-1
+    )
+
+def save_artifacts(model, label_encoders, scaler, feature_names, models_dir="models"):
+    """Save the model and preprocessors to models_dir"""
+    os.makedirs(models_dir, exist_ok=True)
+    
+    joblib.dump(model, os.path.join(models_dir, "titanic_model.pkl"))
+    joblib.dump(label_encoders, os.path.join(models_dir, "label_encoders.pkl"))
+    joblib.dump(scaler, os.path.join(models_dir, "scaler.pkl"))
+    joblib.dump(feature_names, os.path.join(models_dir, "feature_names.pkl"))
+
 def train_model():
     """Train the Titanic survival prediction model"""
     print("Training model...")
@@ -79,13 +97,7 @@ def train_model():
         X, y, test_size=0.2, random_state=42, stratify=y
     )
     
-    model = RandomForestClassifier(
-        n_estimators=100,
-        max_depth=10,
-        random_state=42,
-        n_jobs=-1
-    )
-    
+    model = build_model()
     model.fit(X_train, y_train)
     
     y_pred = model.predict(X_test)
@@ -95,14 +107,8 @@ def train_model():
     print(classification_report(y_test, y_pred))
     
     # Save model and preprocessors
-    os.makedirs("models", exist_ok=True)
-    
-    joblib.dump(model, "models/titanic_model.pkl")
-    joblib.dump(label_encoders, "models/label_encoders.pkl")
-    joblib.dump(scaler, "models/scaler.pkl")
-    
     feature_names = X.columns.tolist()
-    joblib.dump(feature_names, "models/feature_names.pkl")
+    save_artifacts(model, label_encoders, scaler, feature_names)
     
     print("Model saved")
     return model, label_encoders, scaler, feature_names
@@ -87,6 +87,198 @@ def test_prediction(passenger_data):
         print(f"Prediction error: {str(e)}")
         return False
 
+def test_early_exit_prediction(passenger_data):
+    """Test that early-exit prediction matches full prediction"""
+    print(f"Testing early-exit prediction for: {passenger_data.get('name', 'Unknown')}")
+    
+    try:
+        full_response = requests.post(f"{BASE_URL}/predict", json=passenger_data)
+        early_response = requests.post(f"{BASE_URL}/predict", params={"early_exit": "true"}, json=passenger_data)
+        if full_response.status_code != 200 or early_response.status_code != 200:
+            print(f"  Status codes: full {full_response.status_code}, early exit {early_response.status_code}")
+            print(f"  Response: {early_response.text}")
+            return False
+        
+        full = full_response.json()
+        early = early_response.json()
+        
+        print(f"  Trees evaluated: {early['trees_evaluated']}/{full['trees_evaluated']}")
+        return (early['survived'] == full['survived']
+                and early['confidence'] == full['confidence']
+                and early['trees_evaluated'] <= full['trees_evaluated'])
+    except Exception as e:
+        print(f"Early-exit prediction error: {str(e)}")
+        return False
+
+def test_sweep():
+    """Test the what-if sweep endpoint"""
+    print("Testing age x class sweep...")
+    
+    sweep_request = {
+        "passenger": {
+            "pclass": 3,
+            "sex": "female",
+            "age": 30.0,
+            "sibsp": 0,
+            "parch": 0,
+            "fare": 7.925,
+            "embarked": "S"
+        },
+        "axes": [
+            {"feature": "age", "start": 0, "stop": 80, "step": 10},
+            {"feature": "pclass", "values": [1, 2, 3]}
+        ]
+    }
+    
+    try:
+        response = requests.post(f"{BASE_URL}/predict/sweep", json=sweep_request)
+        if response.status_code == 200:
+            data = response.json()
+            print(f"Sweep successful: {data['grid_size']} points")
+            return data['grid_size'] == 27
+        else:
+            print(f"Sweep failed: {response.status_code}")
+            print(f"  Response: {response.text}")
+            return False
+    except Exception as e:
+        print(f"Sweep error: {str(e)}")
+        return False
+
+def test_sweep_matches_predict(passenger_data):
+    """Test that a one-point sweep at the passenger's own age matches /predict"""
+    print(f"Testing sweep against /predict for: {passenger_data.get('name', 'Unknown')}")
+    
+    try:
+        predict = requests.post(f"{BASE_URL}/predict", json=passenger_data)
+        sweep = requests.post(f"{BASE_URL}/predict/sweep", json={
+            "passenger": passenger_data,
+            "axes": [{"feature": "age", "values": [passenger_data["age"]]}]
+        })
+        if predict.status_code != 200 or sweep.status_code != 200:
+            print(f"  Status codes: predict {predict.status_code}, sweep {sweep.status_code}")
+            return False
+        
+        expected = predict.json()
+        point = sweep.json()['points'][0]
+        print(f"  /predict {expected['survival_probability']:.3f}, sweep {point['survival_probability']:.3f}")
+        return (point['survived'] == expected['survived']
+                and point['confidence'] == expected['confidence']
+                and abs(point['survival_probability'] - expected['survival_probability']) < 1e-9)
+    except Exception as e:
+        print(f"Sweep comparison error: {str(e)}")
+        return False
+
+def test_sweep_rejects_oversized_ranges():
+    """Test that ranges whose point count overflows are rejected with 400"""
+    print("Testing sweep range limits...")
+    
+    passenger = {"pclass": 3, "sex": "female", "age": 30.0, "sibsp": 0, "parch": 0,
+                 "fare": 7.925, "embarked": "S"}
+    oversized_axes = [
+        {"feature": "age", "start": 0, "stop": 1e308, "step": 1e-308},
+        {"feature": "age", "start": 0, "stop": 80, "step": 5e-324},
+        {"feature": "fare", "start": -1e308, "stop": 1e308, "step": 1e-10},
+        {"feature": "age", "start": 0, "stop": 80, "step": 0.001},
+    ]
+    
+    try:
+        for axis in oversized_axes:
+            response = requests.post(f"{BASE_URL}/predict/sweep",
+                                     json={"passenger": passenger, "axes": [axis]})
+            if response.status_code != 400:
+                print(f"  Expected 400 for {axis}, got {response.status_code}")
+                return False
+        print(f"  All {len(oversized_axes)} oversized ranges rejected")
+        return True
+    except Exception as e:
+        print(f"Sweep range limit error: {str(e)}")
+        return False
+
+def test_batch_encoding():
+    """Test that batch scoring matches the model on training-time features for data/titanic.csv"""
+    print("Testing batch encoding against training preprocessing...")
+    
+    try:
+        import numpy as np
+        import pandas as pd
+        from src.predictor import TitanicPredictor
+        from src.train_model import preprocess_data
+        
+        predictor = TitanicPredictor()
+        if not predictor.load_model():
+            return False
+        
+        df = pd.read_csv("data/titanic.csv")
+        X, _, _, _ = preprocess_data(df)
+        expected = predictor.model.predict_proba(X.values)[:, 1]
+        batch = predictor.predict_survival_batch(df)['survival_probability'].to_numpy()
+        
+        mismatches = int(np.sum(~np.isclose(batch, expected)))
+        print(f"  {len(df) - mismatches}/{len(df)} rows match training-time encoding")
+        return mismatches == 0
+    except Exception as e:
+        print(f"Batch encoding error: {str(e)}")
+        return False
+
+def test_sweep_encoding():
+    """Test that sweep predictions match batch scoring of the same grid rows"""
+    print("Testing sweep encoding against batch scoring...")
+    
+    try:
+        import numpy as np
+        import pandas as pd
+        from src.predictor import TitanicPredictor
+        
+        predictor = TitanicPredictor()
+        if not predictor.load_model():
+            return False
+        
+        # No cabin, so the base row must be encoded as deck 'U'
+        passenger = {"pclass": 3, "sex": "female", "age": 30.0, "sibsp": 0, "parch": 0,
+                     "fare": 7.925, "embarked": "S", "cabin": None, "name": None}
+        grid = predictor.sweep_survival(passenger, [("age", [2.0, 30.0, 65.0]), ("sibsp", [0, 1, 4])])
+        
+        rows = pd.DataFrame([dict(passenger, age=age, sibsp=int(sibsp))
+                             for age, sibsp in zip(grid['age'], grid['sibsp'])])
+        expected = predictor.predict_survival_batch(rows)['survival_probability'].to_numpy()
+        
+        matched = np.allclose(grid['survival_probability'].to_numpy(), expected)
+        print(f"  Sweep of {len(grid)} points {'matches' if matched else 'does not match'} batch scoring")
+        return matched
+    except Exception as e:
+        print(f"Sweep encoding error: {str(e)}")
+        return False
+
+def test_batch_job():
+    """Test the batch scoring job endpoints"""
+    print("Testing batch scoring job...")
+    
+    try:
+        response = requests.post(f"{BASE_URL}/jobs", data={"input_path": "titanic.csv"})
+        if response.status_code != 202:
+            print(f"Job submission failed: {response.status_code}")
+            print(f"  Response: {response.text}")
+            return False
+        
+        job_id = response.json()['job_id']
+        for _ in range(60):
+            job = requests.get(f"{BASE_URL}/jobs/{job_id}").json()
+            if job['status'] in ("completed", "failed"):
+                break
+            time.sleep(1)
+        
+        print(f"Job {job_id}: {job['status']} ({job['rows_done']}/{job['total_rows']} rows)")
+        if job['status'] != "completed":
+            return False
+        
+        response = requests.get(f"{BASE_URL}/jobs/{job_id}/results")
+        rows = response.text.strip().splitlines()
+        print(f"  Downloaded {len(rows) - 1} scored rows")
+        return response.status_code == 200 and len(rows) - 1 == job['total_rows']
+    except Exception as e:
+        print(f"Batch job error: {str(e)}")
+        return False
+
 def main():
     """Main test function"""
     print("Titanic Survival API - Test Suite")
@@ -101,6 +293,11 @@ def main():
         ("Health Check", test_health_check),
         ("Root Endpoint", test_root_endpoint),
         ("Model Info", test_model_info),
+        ("Sweep", test_sweep),
+        ("Sweep Encoding", test_sweep_encoding),
+        ("Sweep Range Limits", test_sweep_rejects_oversized_ranges),
+        ("Batch Encoding", test_batch_encoding),
+        ("Batch Job", test_batch_job),
     ]
     
     passed_tests = 0
@@ -146,6 +343,17 @@ def main():
             "fare": 69.55,
             "embarked": "S",
             "cabin": "C22"
+        },
+        {
+            "name": "Smith, Dr. John",
+            "pclass": 1,
+            "sex": "male",
+            "age": 50.0,
+            "sibsp": 0,
+            "parch": 0,
+            "fare": 30.0,
+            "embarked": "S",
+            "cabin": "B22"
         }
     ]
     
@@ -155,6 +363,14 @@ def main():
         if test_prediction(passenger):
             passed_tests += 1
         total_tests += 1
+        
+        if test_early_exit_prediction(passenger):
+            passed_tests += 1
+        total_tests += 1
+        
+        if test_sweep_matches_predict(passenger):
+            passed_tests += 1
+        total_tests += 1
     
     # Summary
     print("\n" + "=" * 40)